@@ -4,8 +4,11 @@ Uses Claude API to analyze Erigon and Prysm logs for issues
 """
 
 import anthropic
+import hashlib
 import os
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -15,21 +18,67 @@ API_KEY = os.environ.get("ANTHROPIC_API_KEY")  # Set this in your environment
 # System prompt with your setup details
 SYSTEM_PROMPT = """You are an Ethereum node troubleshooting expert analyzing logs from a dual-node setup."""
 
+# Block size for reading log files backwards from the end
+TAIL_BLOCK_SIZE = 65536
+
+# On-disk cache of past analyses, keyed by a hash of the log content
+ANALYSIS_CACHE_DIR = Path.home() / ".cache" / "prysm_estimator"
+
 def read_log_tail(filepath: str | Path, lines: int = 100) -> str:
-    """Read the last N lines from a log file"""
+    """Read the last N lines from a log file.
+
+    Seeks to the end of the file and reads backwards in fixed-size
+    blocks until enough newlines are seen, so time and memory stay
+    proportional to the tail rather than the whole file. Results are
+    memoized per (path, mtime, size), so repeated reads of an unchanged
+    file within the same process skip the IO entirely.
+    """
     try:
-        with open(filepath, 'r') as f:
-            # Read all lines and get the last N
-            all_lines = f.readlines()
-            return ''.join(all_lines[-lines:])
+        stat = os.stat(filepath)
+        return _read_tail(str(filepath), stat.st_mtime_ns, stat.st_size, lines)
     except FileNotFoundError:
         return f"ERROR: Log file not found at {filepath}"
     except Exception as e:
         return f"ERROR reading {filepath}: {str(e)}"
 
 
-def analyze_logs(erigon_logs: str, prysm_logs: str, custom_question: str | None = None) -> str:
-    """Send logs to Claude API for analysis"""
+@lru_cache(maxsize=32)
+def _read_tail(filepath: str, mtime_ns: int, size: int, lines: int) -> str:
+    # mtime_ns and size only participate in the cache key, so any
+    # rewritten or appended-to file is re-read.
+    with open(filepath, 'rb') as f:
+        pos = size
+        blocks: deque[bytes] = deque()
+        newlines = 0
+        while pos > 0 and newlines <= lines:
+            read_size = min(TAIL_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            blocks.appendleft(block)
+            newlines += block.count(b'\n')
+        tail = b''.join(blocks).decode('utf-8', errors='replace')
+        return ''.join(tail.splitlines(keepends=True)[-lines:])
+
+
+def analyze_logs(
+    erigon_logs: str, prysm_logs: str, custom_question: str | None = None
+) -> str | None:
+    """Send logs to Claude API for analysis; None if the call failed"""
+
+    # If nothing changed since a previous run, reuse the stored analysis
+    # instead of re-sending identical text to the API.
+    key = hashlib.blake2b(
+        "\x00".join((erigon_logs, prysm_logs, custom_question or "")).encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_file = ANALYSIS_CACHE_DIR / f"{key}.txt"
+    if cache_file.is_file():
+        print("Logs unchanged, reusing cached analysis.\n")
+        analysis = cache_file.read_text("utf-8")
+        # Nothing streams on a cache hit, so show the stored text here.
+        print(analysis)
+        return analysis
 
     if not API_KEY:
         print("ERROR: ANTHROPIC_API_KEY environment variable not set")
@@ -59,19 +108,54 @@ def analyze_logs(erigon_logs: str, prysm_logs: str, custom_question: str | None
     print("Analyzing logs with Claude Sonnet 4.5...\n")
 
     try:
-        message = client.messages.create(
+        # Stream the response so the first tokens appear immediately,
+        # and mark the static system prompt as cacheable so repeated
+        # runs reuse it server-side instead of reprocessing it.
+        chunks: list[str] = []
+        with client.messages.stream(
             model="claude-sonnet-4-5-20250929",
             max_tokens=4000,
-            system=SYSTEM_PROMPT,
+            system=[
+                {
+                    "type": "text",
+                    "text": SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             messages=[
                 {"role": "user", "content": user_message}
             ]
-        )
+        ) as stream:
+            for text in stream.text_stream:
+                print(text, end="", flush=True)
+                chunks.append(text)
+        print()
 
-        return message.content[0].text  # type: ignore
+        analysis = "".join(chunks)
+        ANALYSIS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(analysis, "utf-8")
+        return analysis
 
     except anthropic.APIError as e:
-        return f"API Error: {str(e)}"
+        print(f"API Error: {str(e)}")
+        return None
+
+
+def _env_log_path(var: str) -> str:
+    """Resolve a log path env var, exiting early on misconfiguration.
+
+    Failing here avoids spending a whole API call on analyzing two
+    'file not found' error strings.
+    """
+    path = os.environ.get(var)
+    if not path:
+        print(f"ERROR: {var} environment variable not set")
+        print(f"Set it with: export {var}=/path/to/logfile")
+        sys.exit(2)
+    if not os.path.isfile(path):
+        print(f"ERROR: {var} points to a missing file: {path}")
+        sys.exit(2)
+    return path
 
 
 def main() -> None:
@@ -107,6 +191,10 @@ def main() -> None:
         elif sys.argv[1] == "--files" and len(sys.argv) >= 4:
             erigon_file = sys.argv[2]
             prysm_file = sys.argv[3]
+            for log_path in (erigon_file, prysm_file):
+                if not os.path.isfile(log_path):
+                    print(f"ERROR: Log file not found: {log_path}")
+                    sys.exit(2)
             print(f"Reading Erigon logs from: {erigon_file}")
             print(f"Reading Prysm logs from: {prysm_file}")
             erigon_logs = read_log_tail(erigon_file, lines=999999)  # Read entire file
@@ -115,14 +203,8 @@ def main() -> None:
         elif sys.argv[1].isdigit():
             lines = int(sys.argv[1])
             print(f"Reading last {lines} lines from default log locations...")
-            erigon_logs = read_log_tail(
-                os.environ.get("ERIGON_LOG", ""),
-                lines=lines
-            )
-            prysm_logs = read_log_tail(
-                os.environ.get("PRYSM_LOG", ""),
-                lines=lines
-            )
+            erigon_logs = read_log_tail(_env_log_path("ERIGON_LOG"), lines=lines)
+            prysm_logs = read_log_tail(_env_log_path("PRYSM_LOG"), lines=lines)
         else:
             print(f"Unknown argument: {sys.argv[1]}")
             print("Use --help for usage information")
@@ -130,25 +212,21 @@ def main() -> None:
     else:
         # Default: read last 100 lines
         print("Reading last 100 lines from default log locations...")
-        erigon_logs = read_log_tail(
-            os.environ.get("ERIGON_LOG", ""),
-            lines=100
-        )
-        prysm_logs = read_log_tail(
-            os.environ.get("PRYSM_LOG", ""),
-            lines=100
-        )
+        erigon_logs = read_log_tail(_env_log_path("ERIGON_LOG"), lines=100)
+        prysm_logs = read_log_tail(_env_log_path("PRYSM_LOG"), lines=100)
 
     print()
 
-    # Analyze
+    # Analyze (the response is streamed to stdout as it arrives)
     analysis = analyze_logs(erigon_logs, prysm_logs)
 
-    # Output
-    print(analysis)
     print()
     print("=" * 80)
 
+    if analysis is None:
+        # The error was already printed; don't save it as an analysis.
+        sys.exit(1)
+
     # Optionally save to file
     output_file = f"log_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
     with open(output_file, 'w') as f:
@@ -1,52 +1,127 @@
 import json
+import mmap
 import os
+import sys
 from pathlib import Path
 from typing import Any
 
 import requests
 
+try:
+    # Optional: orjson serializes in C, well ahead of the stdlib json
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dump_json(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 # --- CONFIG ---
 PRYSM_API = os.getenv("PRYSM_API", "http://localhost:3500")        # Prysm standard REST API
 ERIGON_RPC = os.getenv("ERIGON_RPC", "http://localhost:8545")      # Erigon JSON-RPC
 
+# Shared session: reuses TCP connections across calls instead of paying
+# socket/keepalive setup per request.
+_SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
 
 def get_erigon_sync_status() -> dict[str, Any]:
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "eth_syncing",
-        "params": [],
-        "id": 1
-    }
+    # JSON-RPC batch: both queries travel in a single round-trip.
+    payload = [
+        {"jsonrpc": "2.0", "method": "eth_syncing", "params": [], "id": 1},
+        {"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 2},
+    ]
     try:
-        r = requests.post(ERIGON_RPC, json=payload, timeout=10)
-        result = r.json().get("result")
-        if not result:
-            return {"synced": True, "details": "Erigon fully synced"}
-        result.pop("stages")
-        return {"synced": False, "result": result}
+        r = _SESSION.post(ERIGON_RPC, json=payload, timeout=10)
+        by_id = {item.get("id"): item.get("result") for item in r.json()}
+
+        syncing = by_id.get(1)
+        if not syncing:
+            status: dict[str, Any] = {"synced": True, "details": "Erigon fully synced"}
+        else:
+            syncing.pop("stages", None)
+            status = {"synced": False, "result": syncing}
+
+        latest_block = by_id.get(2)
+        if latest_block is not None:
+            status["latest_block"] = int(latest_block, 16)
+        return status
     except Exception as e:  # pylint: disable=broad-exception-caught
         return {"error": str(e)}
 
 def get_prysm_sync_status() -> dict[str, Any]:
     try:
-        r = requests.get(f"{PRYSM_API}/eth/v1/node/syncing", timeout=120)
+        r = _SESSION.get(f"{PRYSM_API}/eth/v1/node/syncing", timeout=120)
         return r.json()["data"]  # type: ignore[no-any-return]
     except Exception as e:  # pylint: disable=broad-exception-caught
         return {"error": str(e)}
 
+# Chunk size for counting over an mmap'd log without large allocations
+SCAN_CHUNK_SIZE = 1 << 22  # 4 MiB
+
+def _lines_with_both(
+    data: "mmap.mmap | bytes", warn_needle: bytes, error_needle: bytes
+) -> int:
+    """Count lines containing both keywords, visiting only error hits."""
+    count = 0
+    pos = data.find(error_needle)
+    while pos != -1:
+        line_start = data.rfind(b"\n", 0, pos) + 1
+        line_end = data.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(data)
+        if warn_needle in data[line_start:line_end]:
+            count += 1
+        pos = data.find(error_needle, line_end)
+    return count
+
 def scan_logs(log_file: Path, warn_keyword: str, error_keyword: str) -> dict[str, Any]:
     if not log_file.is_file():
         return {"missing": True}
 
-    error_count = warning_count = total_count = 0
-    log_text = log_file.read_text(encoding="utf8")
-    for line in log_text.split("\n"):
-        if error_keyword in line:
-            error_count += 1
-        elif warn_keyword in line:
-            warning_count += 1
-
-        total_count += 1
+    # The keywords are log-level markers and must be ASCII; encoding
+    # them once here keeps the whole scan in bytes with no per-line
+    # encode/decode work.
+    warn_needle = warn_keyword.encode("ascii")
+    error_needle = error_keyword.encode("ascii")
+
+    # Counting newlines reproduces the old split("\n") total, including
+    # the empty element after a trailing newline.
+    total_count = 1
+    error_count = warning_count = 0
+
+    size = log_file.stat().st_size
+    if size:
+        # mmap skips decoding the file into a str and shares pages with
+        # the OS cache. Counting walks the map in newline-aligned chunks
+        # (the keywords never contain a newline, so none can straddle a
+        # chunk boundary) and bytes.count runs in C via memchr/memmem.
+        with open(log_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                while start < size:
+                    end = min(start + SCAN_CHUNK_SIZE, size)
+                    if end < size:
+                        newline = mm.find(b"\n", end)
+                        end = size if newline == -1 else newline + 1
+                    chunk = mm[start:end]
+                    total_count += chunk.count(b"\n")
+                    error_count += chunk.count(error_needle)
+                    warning_count += chunk.count(warn_needle)
+                    start = end
+
+                # The per-line loop only counted a warning when the error
+                # keyword was absent from the same line; correct for
+                # co-occurrences, but only pay for the line walk when
+                # both keywords actually appear.
+                if error_count and warning_count:
+                    warning_count -= _lines_with_both(mm, warn_needle, error_needle)
 
     return {
         "error_count": error_count,
@@ -57,21 +132,19 @@ def scan_logs(log_file: Path, warn_keyword: str, error_keyword: str) -> dict[str
     }
 
 def assess(erigon_log: Path, prysm_log: Path) -> None:
-    print("🔍 Checking Erigon sync status...")
-    erigon = get_erigon_sync_status()
-    print(json.dumps(erigon, indent=2))
-
-    print("\n🔍 Checking Prysm sync status...")
-    prysm = get_prysm_sync_status()
-    print(json.dumps(prysm, indent=2))
-
-    print("\n🧾 Scanning Prysm logs for issues...")
-    log_summary = scan_logs(prysm_log, "level=warning", "level=error")
-    print(json.dumps(log_summary, indent=2))
-
-    print("\n🧾 Scanning Erigon logs for issues...")
-    log_summary = scan_logs(erigon_log, "[WARN]", "[ERROR]")
-    print(json.dumps(log_summary, indent=2))
+    # Collect the report and write it in one go rather than paying a
+    # line-buffered flush per print call.
+    sections = [
+        "🔍 Checking Erigon sync status...",
+        _dump_json(get_erigon_sync_status()),
+        "\n🔍 Checking Prysm sync status...",
+        _dump_json(get_prysm_sync_status()),
+        "\n🧾 Scanning Prysm logs for issues...",
+        _dump_json(scan_logs(prysm_log, "level=warning", "level=error")),
+        "\n🧾 Scanning Erigon logs for issues...",
+        _dump_json(scan_logs(erigon_log, "[WARN]", "[ERROR]")),
+    ]
+    sys.stdout.write("\n".join(sections) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,24 +1,68 @@
 import datetime
+import mmap
 import os
-import re
+import pickle
 
+try:
+    # Optional: google-re2 compiles to a DFA and matches in linear time
+    # with no backtracking, a big win on the per-line hot loop.
+    import re2 as re  # type: ignore[import-not-found]
+except ImportError:
+    import re  # type: ignore[no-redef]
+
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
 
 from analyse_logs import read_log_tail
 from assessor import assess
 
+# Both patterns share the anchored literal prefix time=" so the engine
+# can reject non-matching lines on the first few bytes; the timestamp is
+# captured with a simple negated class instead of an enumerated one.
 MATCHER = re.compile(
-    r'^time="([\d\-\:\s\.]+)" level.*Processing block .*\. (\d+)\/(\d+).*initial-sync$'
+    r'^time="([^"]+)" level.*Processing block .*\. ([0-9]+)/([0-9]+).*initial-sync$'
 )
 OLD_MATCHER = re.compile(
-    r'^time="([\d\-\:\s\.]+)" level.*latestProcessedSlot\/currentSlot="(\d+)\/(\d+)".*$'
+    r'^time="([^"]+)" level.*latestProcessedSlot/currentSlot="([0-9]+)/([0-9]+)".*$'
+)
+# Both formats folded into one alternation sharing the time="..." prefix,
+# so the hot path runs a single regex per line; groups 2/3 hold the new
+# format's slots, groups 4/5 the old format's. The bytes twin serves the
+# mmap scan path so non-matching bytes are never decoded; the pattern is
+# explicit ASCII classes throughout, so both variants behave identically.
+_COMBINED_PATTERN = (
+    r'^time="([^"]+)" level'
+    r'(?:.*Processing block .*\. ([0-9]+)/([0-9]+).*initial-sync$'
+    r'|.*latestProcessedSlot/currentSlot="([0-9]+)/([0-9]+)".*$)'
 )
+COMBINED_MATCHER = re.compile(_COMBINED_PATTERN)
+COMBINED_MATCHER_B = re.compile(_COMBINED_PATTERN.encode("ascii"))
 GENESIS_TIME = datetime.datetime(2020, 12, 1, 12, 0, 23, tzinfo=datetime.UTC)
 MERGE_SLOT = 4_700_013
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _parse_log_time(timestamp: "str | bytes") -> datetime.datetime:
+    """Parse a fixed-width "YYYY-MM-DD HH:MM:SS" timestamp.
+
+    Direct integer slicing is an order of magnitude faster than
+    strptime, which re-parses the format string and goes through locale
+    handling on every call. Adjacent log lines usually fall in the same
+    second, so the result is also memoized on the raw substring.
+    """
+    return datetime.datetime(
+        int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+        int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]),
+        tzinfo=datetime.UTC,
+    )
+
+# slots=True drops the per-instance __dict__ (one SlotAtTime is created
+# per matched log line); frozen=True makes instances hashable and safe
+# to share across the process-pool boundary.
+@dataclass(slots=True, frozen=True)
 class SlotAtTime:
 
     slot_time: datetime.datetime
@@ -27,20 +71,50 @@ class SlotAtTime:
 
     @staticmethod
     def from_log_line(log_line: str) -> Optional["SlotAtTime"]:
-        match = MATCHER.match(log_line)
-        if match is None:
-            match = OLD_MATCHER.match(log_line)
+        # Cheap substring prefilters: the vast majority of log lines are
+        # not sync-progress lines, so skip the regex entirely for those.
+        if not log_line.startswith('time="'):
+            return None
+        # Every progress line carries a slot/current pair, so a missing
+        # slash rejects the line before the costlier substring searches
+        if "/" not in log_line:
+            return None
+        if ("Processing block" not in log_line
+                and "latestProcessedSlot" not in log_line):
+            return None
+
+        match = COMBINED_MATCHER.match(log_line)
         if match is None:
             return None
 
-        log_time = datetime.datetime.strptime(
-            match.group(1)[:19], "%Y-%m-%d %H:%M:%S"
-        ).replace(tzinfo=datetime.UTC)
-        last_slot = int(match.group(2))
-        cur_slot = int(match.group(3))
+        log_time = _parse_log_time(match.group(1)[:19])
+        if match.group(2) is not None:
+            last_slot = int(match.group(2))
+            cur_slot = int(match.group(3))
+        else:
+            last_slot = int(match.group(4))
+            cur_slot = int(match.group(5))
 
         return SlotAtTime(log_time, last_slot, cur_slot)
 
+    @staticmethod
+    def iter_from_buffer(
+        buf: "mmap.mmap | bytes", start: int = 0
+    ) -> Iterator["SlotAtTime"]:
+        """Yield every sync-progress slot in a whole file buffer.
+
+        Single pass, no per-line dispatch from the caller: the marker
+        search walks the buffer at memmem speed and the precompiled
+        bytes matcher parses candidate lines in place. A plain finditer
+        over the buffer would attempt a match at every line - they all
+        begin with time=" - so anchoring the scan on the rare progress
+        markers is the faster whole-buffer strategy.
+        """
+        for raw_line in _iter_candidate_lines(buf, start):
+            slot = _slot_from_raw_line(raw_line)
+            if slot is not None:
+                yield slot
+
 
 def print_eta(start: SlotAtTime, end: SlotAtTime) -> datetime.timedelta:
     now = datetime.datetime.now(datetime.UTC)
@@ -86,52 +160,421 @@ def print_eta_to_merge(start: SlotAtTime, end: SlotAtTime) -> None:
     print(out)
 
 
-def print_etas(logs_folder: str | Path) -> None:
-    now = datetime.datetime.now(datetime.UTC)
-    start_of_day = now - datetime.timedelta(days=1)
-    start_of_hour = now - datetime.timedelta(hours=1)
+_SCAN_MARKERS = (b"Processing block", b"latestProcessedSlot")
+# Marker searches advance one window at a time so consumers that stop
+# early (like the head scan) never pay for a whole-buffer pass.
+_SCAN_WINDOW = 1 << 20  # 1 MiB
+
+
+def _iter_candidate_lines(buf: "mmap.mmap | bytes", start: int = 0) -> Iterator[bytes]:
+    """Yield only the lines that contain a sync-progress marker.
+
+    Operates directly on an mmap'd buffer with .find (memmem in C), so
+    there is no per-line read, decode or allocation; only the rare
+    candidate lines are sliced out as bytes. Both markers are searched
+    over one window at a time and the hits yielded as each window
+    completes, so taking just the first item touches only the head of
+    the buffer - even when one of the markers never appears in it.
+    """
+    end = len(buf)
+    done = start  # everything before this offset is already yielded
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + _SCAN_WINDOW, end)
+        hits = []
+        for marker in _SCAN_MARKERS:
+            # Back up so a marker straddling the window boundary is
+            # seen; hits inside the previous window are not re-found.
+            pos = buf.find(
+                marker, max(done, window_start - len(marker) + 1), window_end
+            )
+            while pos != -1:
+                hits.append(pos)
+                pos = buf.find(marker, pos + len(marker), window_end)
+        hits.sort()
+        for pos in hits:
+            if pos < done:
+                # Second marker on an already-yielded line
+                continue
+            newline = buf.rfind(b"\n", start, pos)
+            line_start = start if newline == -1 else newline + 1
+            line_end = buf.find(b"\n", pos)
+            if line_end == -1:
+                line_end = end
+            yield bytes(buf[line_start:line_end])
+            done = line_end + 1
+        window_start = window_end
+
+
+def _slot_from_raw_line(raw_line: bytes) -> Optional[SlotAtTime]:
+    """Bytes-mode twin of SlotAtTime.from_log_line for the scan path.
+
+    Callers feed it candidate lines from _iter_candidate_lines, which
+    already guarantee a marker is present, so no prefilter is needed and
+    nothing is decoded - int() accepts the digit groups as bytes and
+    _parse_log_time slices the timestamp bytes directly.
+    """
+    match = COMBINED_MATCHER_B.match(raw_line)
+    if match is None:
+        return None
+
+    log_time = _parse_log_time(match.group(1)[:19])
+    if match.group(2) is not None:
+        return SlotAtTime(log_time, int(match.group(2)), int(match.group(3)))
+    return SlotAtTime(log_time, int(match.group(4)), int(match.group(5)))
+
+
+# First probe size when scanning a large file from its tail
+TAIL_PROBE_BYTES = 16 * 1024 * 1024
+# Below this size a plain read_bytes beats setting up a mapping
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Scan results are keyed on (path, mtime_ns, size) so any change to a
+# file misses the cache. The location is overridable so tests (and
+# non-standard setups) keep it out of ~/.cache.
+SCAN_CACHE_FILE = Path(
+    os.getenv("PRYSM_ESTIMATOR_CACHE")
+    or Path.home() / ".cache" / "prysm_estimator" / "aggregates.pkl"
+)
+
+_CacheKey = tuple[str, int, int]
+
+
+@dataclass(slots=True)
+class _ScanCache:
+    """Per-file scan results persisted between invocations.
+
+    Head entries hold the first slot match of a file; tail entries hold
+    its (first, last) extrema from a full tail scan.
+    """
+
+    head: dict[_CacheKey, SlotAtTime | None] = field(default_factory=dict)
+    tail: dict[_CacheKey, tuple[SlotAtTime | None, SlotAtTime | None]] = field(
+        default_factory=dict
+    )
+
+
+def _cache_key(log_file: Path) -> _CacheKey:
+    stat = log_file.stat()
+    return str(log_file), stat.st_mtime_ns, stat.st_size
+
+
+def _load_scan_cache() -> _ScanCache:
+    try:
+        with open(SCAN_CACHE_FILE, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return _ScanCache()
+    # A cache written by an older layout is simply discarded
+    return cache if isinstance(cache, _ScanCache) else _ScanCache()
+
 
-    all_time_start: SlotAtTime | None = None
+def _save_scan_cache(cache: _ScanCache) -> None:
+    try:
+        SCAN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(SCAN_CACHE_FILE, "wb") as f:
+            pickle.dump(cache, f)
+    except OSError:
+        # The cache is an optimization only; never fail the run for it
+        pass
 
-    # Potentially user provided all-time-start time
+
+@contextmanager
+def _open_buffer(log_file: Path, size: int) -> Iterator["mmap.mmap | bytes"]:
+    """Yield the file contents as a scan buffer.
+
+    Small-to-medium files are read in one gulp - read_bytes skips the
+    BufferedReader setup and its seek/isatty syscalls. Above the
+    threshold the file is mmap'd instead, avoiding a giant allocation.
+    """
+    if size <= MMAP_THRESHOLD:
+        yield log_file.read_bytes()
+        return
+    with open(log_file, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _scan_head(log_file: Path) -> SlotAtTime | None:
+    """Return the first slot match of the file, reading no further."""
+    with _open_buffer(log_file, log_file.stat().st_size) as buf:
+        return next(SlotAtTime.iter_from_buffer(buf), None)
+
+
+# Local extrema of one scan: (first, one_day_start, one_hour_start, last)
+ScanResult = tuple[
+    SlotAtTime | None, SlotAtTime | None, SlotAtTime | None, SlotAtTime | None
+]
+
+
+def _scan_range(
+    buf: "mmap.mmap | bytes",
+    scan_start: int,
+    start_of_day: datetime.datetime,
+    start_of_hour: datetime.datetime,
+) -> ScanResult:
+    """Aggregate the slot extrema over one range of a scan buffer."""
+    first: SlotAtTime | None = None
+    one_day_start: SlotAtTime | None = None
+    one_hour_start: SlotAtTime | None = None
+    last: SlotAtTime | None = None
+    deferred: list[bytes] = []
+
+    for raw_line in _iter_candidate_lines(buf, scan_start):
+
+        # Once the hour start is known (which implies the day start and
+        # first are too), only the final match still matters - defer the
+        # remaining lines unparsed.
+        if one_hour_start is not None:
+            deferred.append(raw_line)
+            continue
+
+        slot = _slot_from_raw_line(raw_line)
+        if slot is None:
+            continue
+
+        if first is None:
+            first = slot
+
+        # Log files are chronologically ordered, so the first match
+        # inside each window is also the earliest one; once set, no
+        # later line in this file can improve it.
+        if one_day_start is None and slot.slot_time >= start_of_day:
+            one_day_start = slot
+        if one_hour_start is None and slot.slot_time >= start_of_hour:
+            one_hour_start = slot
+
+        last = slot
+
+    # Walk the deferred lines backwards until one parses; a truncated
+    # line mid-write at the end of the file then falls through to the
+    # previous good one.
+    for raw_line in reversed(deferred):
+        slot = _slot_from_raw_line(raw_line)
+        if slot is not None:
+            last = slot
+            break
+
+    return first, one_day_start, one_hour_start, last
+
+
+def _scan_file(
+    log_file: Path,
+    start_of_day: datetime.datetime,
+    start_of_hour: datetime.datetime,
+    tail_only: bool = False,
+) -> ScanResult:
+    """Scan one log file and return its local slot extrema.
+
+    Returns (first, one_day_start, one_hour_start, last) so the caller
+    can fold results from several files with a min/max reduction.
+
+    With tail_only=True the scan starts from a probe window at the end
+    of the file and doubles backwards until the earliest match seen
+    predates the one-day window (or the file start is reached), so a
+    multi-GB rotated log is not read in full just to find the recent
+    window starts.
+    """
+    size = log_file.stat().st_size
+    if size == 0:
+        return None, None, None, None
+    probe = TAIL_PROBE_BYTES if tail_only else size
+
+    with _open_buffer(log_file, size) as buf:
+        while True:
+            offset = max(size - probe, 0)
+            scan_start = offset
+            if offset:
+                # Skip the partial line at the probe boundary
+                newline = buf.find(b"\n", offset)
+                scan_start = size if newline == -1 else newline + 1
+
+            result = _scan_range(buf, scan_start, start_of_day, start_of_hour)
+
+            first = result[0]
+            if offset == 0 or (
+                    first is not None and first.slot_time < start_of_day):
+                return result
+            probe *= 2
+
+
+def _env_all_time_start() -> SlotAtTime | None:
+    """Optional user-provided all-time start from the environment.
+
+    fromisoformat is C-implemented and format-strict - anything else is
+    rejected loudly rather than guessed at.
+    """
     all_time_start_time = os.getenv("ALL_TIME_START")
-    if all_time_start_time is not None:
-        all_time_start = SlotAtTime(
-            datetime.datetime.fromisoformat(all_time_start_time), 1, 12584648
+    if all_time_start_time is None:
+        return None
+    try:
+        start_time = datetime.datetime.fromisoformat(all_time_start_time)
+    except ValueError as exc:
+        raise ValueError(
+            "ALL_TIME_START must be an ISO 8601 timestamp, "
+            f"got {all_time_start_time!r}"
+        ) from exc
+    return SlotAtTime(start_time, 1, 12584648)
+
+
+def _select_log_files(logs_folder: str | Path) -> list[Path]:
+    """Return the folder's log files, oldest-modified first."""
+    # os.scandir returns DirEntry objects with cached name/stat info,
+    # avoiding a Path object and an extra stat syscall per entry.
+    with os.scandir(logs_folder) as entries:
+        log_entries = [
+            entry for entry in entries
+            if os.path.splitext(entry.name)[1].lower().startswith(".log")
+            and entry.is_file()
+        ]
+    log_entries.sort(key=lambda entry: entry.stat().st_mtime)
+    return [Path(entry.path) for entry in log_entries]
+
+
+def _head_start(
+    head_file: Path, cache: _ScanCache, kept: _ScanCache
+) -> SlotAtTime | None:
+    """First slot match of the oldest file, served from cache if clean."""
+    head_key = _cache_key(head_file)
+    if head_key in cache.head:
+        result = cache.head[head_key]
+    else:
+        print("Parsing", head_file, "(head)")
+        result = _scan_head(head_file)
+    kept.head[head_key] = result
+    return result
+
+
+def _reusable_tail_results(
+    selected_files: list[Path],
+    cache: _ScanCache,
+    kept: _ScanCache,
+    start_of_day: datetime.datetime,
+) -> tuple[list[ScanResult | None], list[_CacheKey]]:
+    """Fill in results for files whose cached tail scan is still valid."""
+    results: list[ScanResult | None] = [None] * len(selected_files)
+    tail_keys = []
+    for idx, log_file in enumerate(selected_files):
+        key = _cache_key(log_file)
+        tail_keys.append(key)
+        cached = cache.tail.get(key)
+        if cached is not None:
+            kept.tail[key] = cached
+            first, last = cached
+            # The windowed aggregates depend on the current cutoffs, so a
+            # cached entry is only reusable when the whole file predates
+            # the day window - then both windows are known to be empty
+            # and first/last depend on content alone.
+            if last is not None and last.slot_time < start_of_day:
+                results[idx] = (first, None, None, last)
+    return results, tail_keys
+
+
+def _scan_selected(
+    selected_files: list[Path],
+    cache: _ScanCache,
+    kept: _ScanCache,
+    now: datetime.datetime,
+    have_all_time_start: bool,
+) -> list[ScanResult]:
+    """Scan the newest log files, reusing and refreshing the cache."""
+    start_of_day = now - datetime.timedelta(days=1)
+    start_of_hour = now - datetime.timedelta(hours=1)
+    results, tail_keys = _reusable_tail_results(
+        selected_files, cache, kept, start_of_day
+    )
+    to_scan = [idx for idx, result in enumerate(results) if result is None]
+
+    # Scan the newest file first: if its earliest match already predates
+    # the day window, the older selected files cannot contribute to any
+    # aggregate (their lines are older still) and are skipped without a
+    # single read.
+    if to_scan:
+        newest_idx = to_scan.pop()
+        print("Parsing", selected_files[newest_idx])
+        newest_result = _scan_file(
+            selected_files[newest_idx], start_of_day, start_of_hour, True
+        )
+        results[newest_idx] = newest_result
+        kept.tail[tail_keys[newest_idx]] = (newest_result[0], newest_result[3])
+
+        newest_first = newest_result[0]
+        if (have_all_time_start
+                and newest_first is not None
+                and newest_first.slot_time < start_of_day):
+            for idx in to_scan:
+                results[idx] = (None, None, None, None)
+            to_scan = []
+
+    # At most one older tail file can remain here (selected_files holds
+    # the newest two and the newest was already scanned above), so it is
+    # scanned in-process; a process pool would cost more to spawn than a
+    # single scan saves.
+    for idx in to_scan:
+        print("Parsing", selected_files[idx])
+        scan_result = _scan_file(
+            selected_files[idx], start_of_day, start_of_hour, True
         )
+        results[idx] = scan_result
+        kept.tail[tail_keys[idx]] = (scan_result[0], scan_result[3])
 
+    return [result for result in results if result is not None]
+
+
+def _fold_results(
+    results: list[ScanResult], all_time_start: SlotAtTime | None
+) -> tuple[
+    SlotAtTime | None, SlotAtTime | None, SlotAtTime | None, SlotAtTime | None
+]:
+    """Fold per-file extrema, in file order, into the global aggregates."""
     one_day_start: SlotAtTime | None = None
     one_hour_start: SlotAtTime | None = None
     all_end: SlotAtTime | None = None
-    log_files = sorted(
-        (log_file
-         for log_file in Path(logs_folder).iterdir()
-         if log_file.suffix.lower().startswith(".log")),
-        key=lambda x: x.lstat().st_mtime,
-    )
 
-    # The first and last two log files suffice
-    for log_file in log_files[:1] + log_files[-2:]:
+    for first, day_start, hour_start, last in results:
+        if all_time_start is None and first is not None:
+            # If not hard-coded, pick first
+            all_time_start = first
 
-        print("Parsing", log_file)
-        for log_line in log_file.read_text("utf8").splitlines():
+        if day_start is not None:
+            if one_day_start is None or day_start.slot < one_day_start.slot:
+                one_day_start = day_start
+        if hour_start is not None:
+            if (one_hour_start is None
+                    or hour_start.slot_time < one_hour_start.slot_time):
+                one_hour_start = hour_start
 
-            slot = SlotAtTime.from_log_line(log_line)
-            if slot is None:
-                continue
+        if last is not None:
+            all_end = last
+
+    return all_time_start, one_day_start, one_hour_start, all_end
+
+
+def print_etas(logs_folder: str | Path) -> None:
+    now = datetime.datetime.now(datetime.UTC)
 
-            if all_time_start is None:
-                # If not hard-code, pick first
-                all_time_start = slot
+    all_time_start = _env_all_time_start()
+    log_files = _select_log_files(logs_folder)
 
-            if slot.slot_time >= start_of_day:
-                if one_day_start is None or slot.slot < one_day_start.slot:
-                    one_day_start = slot
-            if slot.slot_time >= start_of_hour:
-                if one_hour_start is None or slot.slot_time < one_hour_start.slot_time:
-                    one_hour_start = slot
+    cache = _load_scan_cache()
+    # Only keys touched in this run are written back, so entries for
+    # rotated-away or deleted files do not accumulate in the pickle.
+    kept = _ScanCache()
 
-            all_end = slot
+    # all_time_start only needs the head of the oldest file, and the
+    # day/hour windows plus all_end only need the tails of the newest
+    # two, so IO is bounded regardless of the total corpus size.
+    if all_time_start is None and log_files:
+        all_time_start = _head_start(log_files[0], cache, kept)
+
+    results = _scan_selected(
+        log_files[-2:], cache, kept, now, all_time_start is not None
+    )
+    _save_scan_cache(kept)
+
+    all_time_start, one_day_start, one_hour_start, all_end = _fold_results(
+        results, all_time_start
+    )
 
     print()
     time_format = "%Y-%m-%d %H:%M"
@@ -159,6 +602,9 @@ def print_etas(logs_folder: str | Path) -> None:
     print("Last Hour Start (UTC):", one_hour_start.slot_time.strftime(time_format))
     print_eta(one_hour_start, all_end)
 
+    # The parse is done; no point keeping the memoized timestamps alive
+    _parse_log_time.cache_clear()
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from analyse_logs import read_log_tail, TAIL_BLOCK_SIZE
+
+
+class TestReadLogTail:
+
+    def test_returns_last_n_lines(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log"
+        log_file.write_text(
+            "".join(f"line {i}\n" for i in range(10)), encoding="utf8"
+        )
+
+        result = read_log_tail(log_file, lines=3)
+        assert result == "line 7\nline 8\nline 9\n"
+
+    def test_fewer_lines_than_requested(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log"
+        log_file.write_text("only line\n", encoding="utf8")
+
+        result = read_log_tail(log_file, lines=100)
+        assert result == "only line\n"
+
+    def test_no_trailing_newline(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log"
+        log_file.write_text("first\nsecond\nthird", encoding="utf8")
+
+        result = read_log_tail(log_file, lines=2)
+        assert result == "second\nthird"
+
+    def test_file_larger_than_block(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log"
+        line_count = 2 * TAIL_BLOCK_SIZE // 100
+        log_file.write_text(
+            "".join(f"line {i:090d}\n" for i in range(line_count)),
+            encoding="utf8",
+        )
+
+        result = read_log_tail(log_file, lines=5)
+        expected = "".join(
+            f"line {i:090d}\n" for i in range(line_count - 5, line_count)
+        )
+        assert result == expected
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        result = read_log_tail(tmp_path / "nonexistent.log")
+        assert result.startswith("ERROR: Log file not found")
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "empty.log"
+        log_file.write_text("", encoding="utf8")
+
+        result = read_log_tail(log_file)
+        assert result == ""
@@ -14,35 +14,44 @@ from assessor import (
 
 class TestGetErigonSyncStatus:
 
-    @patch("assessor.requests.post")
+    @patch("assessor._SESSION.post")
     def test_fully_synced(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
-        mock_response.json.return_value = {"result": False}
+        mock_response.json.return_value = [
+            {"id": 1, "result": False},
+            {"id": 2, "result": "0x10"},
+        ]
         mock_post.return_value = mock_response
 
         result = get_erigon_sync_status()
-        assert result == {"synced": True, "details": "Erigon fully synced"}
+        assert result == {
+            "synced": True,
+            "details": "Erigon fully synced",
+            "latest_block": 16,
+        }
         mock_post.assert_called_once_with(
             "http://localhost:8545",
-            json={
-                "jsonrpc": "2.0",
-                "method": "eth_syncing",
-                "params": [],
-                "id": 1,
-            },
+            json=[
+                {"jsonrpc": "2.0", "method": "eth_syncing", "params": [], "id": 1},
+                {"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 2},
+            ],
             timeout=10,
         )
 
-    @patch("assessor.requests.post")
+    @patch("assessor._SESSION.post")
     def test_still_syncing(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "result": {
-                "currentBlock": "0x100",
-                "highestBlock": "0x200",
-                "stages": ["stage1", "stage2"],
-            }
-        }
+        mock_response.json.return_value = [
+            {
+                "id": 1,
+                "result": {
+                    "currentBlock": "0x100",
+                    "highestBlock": "0x200",
+                    "stages": ["stage1", "stage2"],
+                },
+            },
+            {"id": 2, "result": "0x200"},
+        ]
         mock_post.return_value = mock_response
 
         result = get_erigon_sync_status()
@@ -52,19 +61,23 @@ class TestGetErigonSyncStatus:
                 "currentBlock": "0x100",
                 "highestBlock": "0x200",
             },
+            "latest_block": 512,
         }
 
-    @patch("assessor.requests.post")
+    @patch("assessor._SESSION.post")
     def test_connection_error(self, mock_post: MagicMock) -> None:
         mock_post.side_effect = ConnectionError("Connection refused")
 
         result = get_erigon_sync_status()
         assert result == {"error": "Connection refused"}
 
-    @patch("assessor.requests.post")
+    @patch("assessor._SESSION.post")
     def test_result_none(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
-        mock_response.json.return_value = {"result": None}
+        mock_response.json.return_value = [
+            {"id": 1, "result": None},
+            {"id": 2, "result": None},
+        ]
         mock_post.return_value = mock_response
 
         result = get_erigon_sync_status()
@@ -73,7 +86,7 @@ class TestGetErigonSyncStatus:
 
 class TestGetPrysmSyncStatus:
 
-    @patch("assessor.requests.get")
+    @patch("assessor._SESSION.get")
     def test_success(self, mock_get: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -91,7 +104,7 @@ class TestGetPrysmSyncStatus:
             "http://localhost:3500/eth/v1/node/syncing", timeout=120
         )
 
-    @patch("assessor.requests.get")
+    @patch("assessor._SESSION.get")
     def test_connection_error(self, mock_get: MagicMock) -> None:
         mock_get.side_effect = ConnectionError("Connection refused")
 
@@ -136,6 +149,20 @@ class TestScanLogs:
         assert result["error_rate"] == "0.00 %"
         assert result["warning_rate"] == "0.00 %"
 
+    def test_error_and_warning_on_same_line(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log"
+        # A line with both keywords counts as an error, not a warning
+        log_file.write_text(
+            "level=error retrying after level=warning condition\n"
+            "level=warning alone\n"
+            "INFO ok\n",
+            encoding="utf8",
+        )
+
+        result = scan_logs(log_file, "level=warning", "level=error")
+        assert result["error_count"] == 1
+        assert result["warning_count"] == 1
+
     def test_erigon_keywords(self, tmp_path: Path) -> None:
         log_file = tmp_path / "erigon.log"
         log_file.write_text(
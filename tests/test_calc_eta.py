@@ -1,5 +1,6 @@
 import datetime
 import os
+import pickle
 import time as time_module
 from pathlib import Path
 from unittest.mock import patch
@@ -47,6 +48,38 @@ class TestSlotAtTimeFromLogLine:
         assert result is None
 
 
+class TestIterFromBuffer:
+
+    def test_yields_slots_in_order(self) -> None:
+        buf = (
+            b"random noise line\n"
+            b'time="2024-06-15 10:30:45.123" level=info msg="Processing block '
+            b'blah. 5000/10000 stuff" prefix=initial-sync\n'
+            b"more noise\n"
+            b'time="2024-06-15 10:31:45.123" level=info '
+            b'msg="x" latestProcessedSlot/currentSlot="5005/10000" stuff\n'
+        )
+        slots = list(SlotAtTime.iter_from_buffer(buf))
+        assert [slot.slot for slot in slots] == [5000, 5005]
+        assert slots[0].current_slot == 10000
+
+    def test_empty_buffer(self) -> None:
+        assert list(SlotAtTime.iter_from_buffer(b"")) == []
+
+    def test_match_straddling_search_window(self) -> None:
+        from calc_eta import _SCAN_WINDOW
+
+        match_line = (
+            b'time="2024-06-15 10:30:45.123" level=info msg="Processing block '
+            b'blah. 5000/10000 stuff" prefix=initial-sync\n'
+        )
+        # Place the marker right across the window boundary
+        pad_len = _SCAN_WINDOW - match_line.find(b"block")
+        buf = b"x" * (pad_len - 1) + b"\n" + match_line
+        slots = list(SlotAtTime.iter_from_buffer(buf))
+        assert [slot.slot for slot in slots] == [5000]
+
+
 class TestPrintEta:
 
     def test_positive_cover_speed(self, capsys: pytest.CaptureFixture[str]) -> None:
@@ -109,9 +142,22 @@ class TestPrintEta:
 
 class TestPrintEtas:
 
+    @pytest.fixture(autouse=True)
+    def _isolated_scan_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Keep the persisted scan cache out of the developer's ~/.cache
+        monkeypatch.setattr(
+            "calc_eta.SCAN_CACHE_FILE", tmp_path / "aggregates.pkl"
+        )
+
     @staticmethod
     def _make_log_line(dt: datetime.datetime, slot: int, current: int) -> str:
-        time_str = dt.strftime("%Y-%m-%d %H:%M:%S.000")
+        # f-string instead of strftime so large generated fixtures stay cheap
+        time_str = (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.000"
+        )
         return (
             f'time="{time_str}" level=info msg="Processing block '
             f"blah. {slot}/{current} some stuff\" prefix=initial-sync"
@@ -217,7 +263,80 @@ class TestPrintEtas:
         captured = capsys.readouterr()
         assert "Last processed slot: 45000" in captured.out
 
-    def test_one_day_start_picks_smallest_slot(
+    def test_second_run_reuses_scan_cache(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        now = datetime.datetime.now(datetime.UTC)
+
+        old_log = tmp_path / "a.log"
+        old_log.write_text(
+            self._make_log_line(now - datetime.timedelta(days=3), 1000, 50000) + "\n"
+            + self._make_log_line(now - datetime.timedelta(days=2), 5000, 50000) + "\n",
+            encoding="utf8",
+        )
+        os.utime(old_log, (1000, 1000))
+
+        new_log = tmp_path / "b.log"
+        new_log.write_text(
+            self._make_log_line(now - datetime.timedelta(hours=12), 30000, 50000) + "\n"
+            + self._make_log_line(now - datetime.timedelta(minutes=30), 40000, 50000) + "\n"
+            + self._make_log_line(now - datetime.timedelta(minutes=1), 45000, 50000) + "\n",
+            encoding="utf8",
+        )
+        os.utime(new_log, (2000, 2000))
+
+        print_etas(tmp_path)
+        first_out = capsys.readouterr().out
+        assert f"Parsing {old_log} (head)" in first_out
+        assert first_out.count(f"Parsing {old_log}") == 2  # head + tail
+
+        print_etas(tmp_path)
+        second_out = capsys.readouterr().out
+        # Head result and the fully-aged a.log tail come from the cache;
+        # only the still-growing newest file is parsed again.
+        assert f"Parsing {old_log}" not in second_out
+        assert f"Parsing {new_log}" in second_out
+        assert "Last processed slot: 45000" in second_out
+
+        with open(tmp_path / "aggregates.pkl", "rb") as f:
+            cache = pickle.load(f)
+        # One head and two tail entries, nothing stale
+        assert len(cache.head) == 1
+        assert len(cache.tail) == 2
+
+    def test_newest_file_short_circuits_older_tail(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        now = datetime.datetime.now(datetime.UTC)
+
+        old_log = tmp_path / "a.log"
+        old_log.write_text(
+            self._make_log_line(now - datetime.timedelta(days=5), 100, 50000) + "\n"
+            + self._make_log_line(now - datetime.timedelta(days=4), 1000, 50000) + "\n",
+            encoding="utf8",
+        )
+        os.utime(old_log, (1000, 1000))
+
+        new_log = tmp_path / "b.log"
+        new_log.write_text(
+            self._make_log_line(now - datetime.timedelta(days=2), 20000, 50000) + "\n"
+            + self._make_log_line(now - datetime.timedelta(minutes=30), 40000, 50000) + "\n"
+            + self._make_log_line(now - datetime.timedelta(minutes=1), 45000, 50000) + "\n",
+            encoding="utf8",
+        )
+        os.utime(new_log, (2000, 2000))
+
+        print_etas(tmp_path)
+
+        captured = capsys.readouterr()
+        # The newest file starts before the day window, so the older
+        # tail file is read for its head only, never for its tail.
+        assert captured.out.count(f"Parsing {old_log}") == 1
+        assert f"Parsing {old_log} (head)" in captured.out
+        assert f"Parsing {new_log}" in captured.out
+        assert "Last processed slot: 45000" in captured.out
+
+    def test_one_day_start_is_first_in_window(
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         now = datetime.datetime.now(datetime.UTC)
@@ -225,7 +344,8 @@ class TestPrintEtas:
         log_file = tmp_path / "sync.log"
         lines = [
             self._make_log_line(now - datetime.timedelta(days=2), 1000, 50000),
-            # Two entries within last day - should pick the one with smallest slot
+            # Logs are chronological, so the first in-window entry is the
+            # day baseline even when a later one carries a smaller slot
             self._make_log_line(now - datetime.timedelta(hours=10), 25000, 50000),
             self._make_log_line(now - datetime.timedelta(hours=5), 20000, 50000),
             self._make_log_line(now - datetime.timedelta(minutes=30), 40000, 50000),
@@ -237,6 +357,8 @@ class TestPrintEtas:
 
         captured = capsys.readouterr()
         assert "Last Day Start (UTC)" in captured.out
+        # 45000 - 25000: the baseline is the -10h entry, not slot 20000
+        assert "20000 slots" in captured.out
 
     def test_one_hour_start_picks_earliest_time(
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]